@@ -4,12 +4,13 @@ Works with a chat model with tool calling support.
 """
 from typing import Dict, List, Literal, cast
 
-from langchain_core.messages import AIMessage
+from langchain_core.messages import AIMessage, SystemMessage
 from langgraph.graph import StateGraph
 from langgraph.prebuilt import ToolNode
 from langgraph.runtime import Runtime
 
 from react_agent.context import Context
+from react_agent.prompts import SYSTEM_MESSAGE, SYSTEM_PROMPT
 from react_agent.state import InputState, State
 from react_agent.tools import TOOLS
 from react_agent.utils import load_chat_model
@@ -34,14 +35,18 @@ async def call_model(
     model = load_chat_model(runtime.context.model).bind_tools(TOOLS)
 
     # Format the system prompt. Customize this to change the agent's behavior.
-    system_message = runtime.context.system_prompt
+    # The default prompt uses a prebuilt message instead of a new one per call.
+    system_prompt = runtime.context.system_prompt
+    system_message = (
+        SYSTEM_MESSAGE
+        if system_prompt == SYSTEM_PROMPT
+        else SystemMessage(content=system_prompt)
+    )
 
     # Get the model's response
     response = cast( # type: ignore[redundant-cast]
         AIMessage,
-        await model.ainvoke(
-            [{"role": "system", "content": system_message}, *state.messages]
-        ),
+        await model.ainvoke([system_message, *state.messages]),
     )
 
     # Handle the case when it's the last step and the model still wants to use a tool
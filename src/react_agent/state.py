@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import operator
 from dataclasses import dataclass, field
 from typing import List, Sequence
 
@@ -53,12 +54,15 @@ class State(InputState):
     It is set to 'True' when the step count reaches recursion_limit - 1.
     """
 
-    query: List[str] = field(default_factory=list)
+    query: Annotated[List[str], operator.add] = field(default_factory=list)
     """
     List of SQL queries that have been executed during the conversation.
     
     This tracks all SELECT queries run against the database, allowing the agent
     to maintain a history of what data has been queried.
+
+    The `operator.add` annotation makes tools report only the queries they ran;
+    those are appended to the existing history by the graph.
     """
 
     # Additional attributes can be added here as needed.
@@ -4,31 +4,210 @@ It includes tools for getting the current date, inspecting database schema,
 and executing SELECT queries on a SQLite database.
 """
 
+import asyncio
+import functools
+import io
 import json
+import logging
+import os
+import queue
+import re
 import sqlite3
+import time
+from contextlib import closing, contextmanager
 from datetime import date
-from typing import Any, Callable, List
+from typing import Any, Dict, Iterator, List, Tuple
 
 from langchain_core.messages import ToolMessage
-from langchain_core.tools import tool
+from langchain_core.tools import BaseTool, StructuredTool, tool
 from langchain.tools import ToolRuntime
 from langgraph.types import Command
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with langsmith
+    orjson = None  # type: ignore[assignment]
 
-query_list = []
+logger = logging.getLogger(__name__)
+
+DB_PATH = "data/budget.db"
+
+# Number of compiled statements the driver keeps per connection. Large enough to
+# hold the introspection statements plus the agent's working set of queries.
+_CACHED_STATEMENTS = 256
+
+# Number of sample rows returned per table by `inspect_sqlite_db`.
+_SAMPLE_ROWS = 5
+
+# Number of rows fetched from SQLite and encoded together by `_rows_to_json`.
+_FETCH_BATCH = 1000
+
+# Maximum number of idle connections kept for reuse. Each tool call borrows its
+# own connection, so concurrent tool calls read the database in parallel
+# instead of queuing on a shared one.
+_POOL_SIZE = 4
+
+# Idle connections are stored with the path they were opened for, so a change
+# of DB_PATH never hands out a connection to the previous database.
+_pool: "queue.LifoQueue[Tuple[str, sqlite3.Connection]]" = queue.LifoQueue(
+    maxsize=_POOL_SIZE
+)
+
+_json_encoder = json.JSONEncoder(default=str, separators=(",", ":"))
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize query rows to compact JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return _json_encoder.encode(obj)
+
+
+# Authorizer actions a read-only query needs. Anything else (writes, ATTACH,
+# PRAGMA, ...) is refused while the statement is being compiled.
+_READ_ONLY_ACTIONS = frozenset(
+    {
+        sqlite3.SQLITE_SELECT,
+        sqlite3.SQLITE_READ,
+        sqlite3.SQLITE_FUNCTION,
+        sqlite3.SQLITE_RECURSIVE,
+    }
+)
+_SQLITE_OK = sqlite3.SQLITE_OK
+_SQLITE_DENY = sqlite3.SQLITE_DENY
+
+
+def _authorize_read_only(action: int, *args: Any) -> int:
+    """Allow only the actions in `_READ_ONLY_ACTIONS`."""
+    return _SQLITE_OK if action in _READ_ONLY_ACTIONS else _SQLITE_DENY
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """Open a read-only connection to the database at `db_path`.
+
+    The driver keeps an LRU cache of compiled statements per connection, so
+    repeated queries skip SQL parsing as long as the connection is reused.
+    """
+    conn = sqlite3.connect(
+        db_path,
+        check_same_thread=False,
+        isolation_level=None,
+        cached_statements=_CACHED_STATEMENTS,
+    )
+    conn.execute("PRAGMA query_only=1")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")
+    conn.set_authorizer(_authorize_read_only)
+    return conn
+
+
+@contextmanager
+def _connection() -> Iterator[sqlite3.Connection]:
+    """Borrow a connection to DB_PATH from the pool, opening one if none is idle.
+
+    Idle connections opened for a different path are closed and skipped.
+    """
+    db_path = DB_PATH
+    while True:
+        try:
+            conn_path, conn = _pool.get_nowait()
+        except queue.Empty:
+            conn = _connect(db_path)
+            break
+        if conn_path == db_path:
+            break
+        conn.close()
+    try:
+        yield conn
+    finally:
+        try:
+            _pool.put_nowait((db_path, conn))
+        except queue.Full:
+            conn.close()
+
+
+def _close_connections() -> None:
+    """Close all idle pooled connections."""
+    while True:
+        try:
+            _, conn = _pool.get_nowait()
+        except queue.Empty:
+            return
+        conn.close()
+
+
+# Matches SQL that starts with SELECT, allowing leading whitespace and comments.
+# Each alternative can only match a given prefix one way (block comments cannot
+# contain "*/"), which keeps matching linear on adversarial input.
+_SELECT_RE = re.compile(
+    r"(?:\s|--[^\n]*(?:\n|$)|/\*(?:[^*]|\*(?!/))*\*/)*select\b", re.IGNORECASE
+)
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote an SQLite identifier so it can be safely embedded in SQL text."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _select_json(conn: sqlite3.Connection, query: str) -> str:
+    """Execute `query` on `conn` and return its rows as JSON."""
+    cursor = conn.cursor()
+    cursor.execute(query)
+    return _rows_to_json(cursor)
+
+
+def _rows_to_json(cursor: sqlite3.Cursor) -> str:
+    """Serialize the rows of an executed cursor as a JSON array of objects.
+
+    Rows are fetched in batches and each batch is encoded in a single call to a
+    C JSON encoder, so at most one batch of row objects is alive at a time.
+    """
+    col_names = [description[0] for description in cursor.description]
+    rows = cursor.fetchmany(_FETCH_BATCH)
+    if len(rows) < _FETCH_BATCH:
+        # The whole result fits in one batch. This is the common case for
+        # aggregates like SUM(Expenditure), which return a single row, so encode
+        # it directly without the streaming buffer.
+        return _dumps([dict(zip(col_names, row)) for row in rows])
+
+    buf = io.StringIO()
+    buf.write("[")
+    separator = ""
+    while rows:
+        encoded = _dumps([dict(zip(col_names, row)) for row in rows])
+        buf.write(separator)
+        buf.write(encoded[1:-1])
+        separator = ","
+        rows = cursor.fetchmany(_FETCH_BATCH)
+    buf.write("]")
+    return buf.getvalue()
+
+
+# The agent asks for today's date repeatedly within a conversation, so the
+# formatted date is reused for up to _TODAY_TTL seconds, never past midnight.
+_TODAY_TTL = 60.0
+_today_value = ""
+_today_expires = 0.0
 
 
 @tool
 def get_todays_date() -> str:
     """Get today's date in YYYY-MM-DD format."""
-    print("[DEBUG] get_todays_date tool called")
-    today = date.today().strftime("%Y-%m-%d")  # e.g., "2025-08-14"
-    return today
+    global _today_value, _today_expires
+    logger.debug("get_todays_date tool called")
+    now = time.time()
+    if now >= _today_expires:
+        local = time.localtime(now)
+        # Seconds left until local midnight, including the fraction of the
+        # current second so the entry never outlives the day it was read on
+        elapsed = local.tm_hour * 3600 + local.tm_min * 60 + local.tm_sec + now % 1
+        _today_value = date.today().isoformat()  # e.g., "2025-08-14"
+        _today_expires = now + min(_TODAY_TTL, 86400 - elapsed)
+    return _today_value
 
 
-@tool
-def execute_sqlite_select(
+def _execute_sqlite_select(
     query: str, 
     runtime: ToolRuntime
 ) -> Command:
@@ -37,17 +216,16 @@ def execute_sqlite_select(
     
     Use this tool to query the budget database at data/budget.db.
     Only SELECT statements are allowed for safety reasons.
-    Results are returned as a list of dictionaries.
+    Results are returned as a JSON array of objects, one per row.
     
     Args:
         query: SQL SELECT query to execute. Must start with SELECT. Example: 'SELECT * FROM budget WHERE amount > 100'
     """
     try:
         # Enforce SELECT-only rule
-        if not query.strip().lower().startswith("select"):
+        if not _SELECT_RE.match(query):
             return Command(
                 update={
-                    "query": query_list,
                     "messages": [
                         ToolMessage(
                             "Error: Only SELECT queries are allowed.",
@@ -57,27 +235,17 @@ def execute_sqlite_select(
                 }
             )
 
-        conn = sqlite3.connect("data/budget.db")
-        cursor = conn.cursor()
-        cursor.execute(query)
-
-        rows = cursor.fetchall()
-        col_names = [description[0] for description in cursor.description]
-        conn.close()
-
-        query_list.append(query)
+        with _connection() as conn:
+            results = _select_json(conn, query)
 
-        # Format results
-        results = [dict(zip(col_names, row)) for row in rows]
         state_update = {
-            "query": query_list,
-            "messages": [ToolMessage(str(results), tool_call_id=runtime.tool_call_id)],
+            "query": [query],
+            "messages": [ToolMessage(results, tool_call_id=runtime.tool_call_id)],
         }
         return Command(update=state_update)
 
     except Exception as e:
         state_update = {
-            "query": query_list,
             "messages": [
                 ToolMessage(f"Error executing query: {e}", tool_call_id=runtime.tool_call_id)
             ],
@@ -85,50 +253,158 @@ def execute_sqlite_select(
         return Command(update=state_update)
 
 
-@tool
-def inspect_sqlite_db() -> str:
+async def _aexecute_sqlite_select(query: str, runtime: ToolRuntime) -> Command:
+    """Run `_execute_sqlite_select` in a worker thread."""
+    return await asyncio.to_thread(_execute_sqlite_select, query, runtime)
+
+
+# The database tools are built with both a sync and an async implementation.
+# The async one runs the blocking SQLite work in a worker thread so the event
+# loop stays free while the query executes.
+execute_sqlite_select = StructuredTool.from_function(
+    func=_execute_sqlite_select,
+    coroutine=_aexecute_sqlite_select,
+    name="execute_sqlite_select",
+)
+
+
+def _execute_sqlite_select_batch(
+    queries: List[str],
+    runtime: ToolRuntime
+) -> Command:
     """
-    Inspect the complete structure of the budget database.
+    Execute several SELECT queries on the SQLite database in a single call.
     
-    Returns all table names, their CREATE TABLE schemas, and the first 5 sample rows
-    from each table in JSON format. Use this before querying to understand the database structure.
+    Prefer this over repeated execute_sqlite_select calls whenever you already
+    know more than one query you need to run.
+    Only SELECT statements are allowed for safety reasons.
+    Results are returned as a JSON array with one object per query, in order:
+    {"query": ..., "rows": [...]} on success or {"query": ..., "error": ...}.
+    
+    Args:
+        queries: SQL SELECT queries to execute, in order. Each must start with SELECT.
     """
-    db_path = "data/budget.db"
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-
+    executed = []
+    entries = []
     try:
-        # Step 1: Get all table names
-        print("[DEBUG] Inspecting SQLite database at", db_path)
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        tables = [row["name"] for row in cursor.fetchall()]
+        with _connection() as conn:
+            for query in queries:
+                if not _SELECT_RE.match(query):
+                    result = '"error":' + _dumps("Only SELECT queries are allowed.")
+                else:
+                    try:
+                        result = '"rows":' + _select_json(conn, query)
+                        executed.append(query)
+                    except Exception as e:
+                        result = '"error":' + _dumps(f"Error executing query: {e}")
+                entries.append('{"query":' + _dumps(query) + "," + result + "}")
+
+    except Exception as e:
+        # The connection could not be opened; report it like the single-query tool
+        return Command(
+            update={
+                "messages": [
+                    ToolMessage(
+                        f"Error executing query: {e}", tool_call_id=runtime.tool_call_id
+                    )
+                ],
+            }
+        )
+
+    state_update: Dict[str, Any] = {
+        "messages": [
+            ToolMessage("[" + ",".join(entries) + "]", tool_call_id=runtime.tool_call_id)
+        ],
+    }
+    if executed:
+        state_update["query"] = executed
+    return Command(update=state_update)
+
+
+async def _aexecute_sqlite_select_batch(
+    queries: List[str], runtime: ToolRuntime
+) -> Command:
+    """Run `_execute_sqlite_select_batch` in a worker thread."""
+    return await asyncio.to_thread(_execute_sqlite_select_batch, queries, runtime)
+
 
+execute_sqlite_select_batch = StructuredTool.from_function(
+    func=_execute_sqlite_select_batch,
+    coroutine=_aexecute_sqlite_select_batch,
+    name="execute_sqlite_select_batch",
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _inspect_cached(db_path: str, mtime_ns: int, size: int) -> str:
+    """Build the JSON description of the database.
+
+    The arguments are the database file's path, modification time and size;
+    they are only used as the cache key so the result is rebuilt whenever the
+    file or the configured path changes.
+    """
+    # Pooled connections may point at a previously configured DB_PATH, so the
+    # description is read through a connection opened for `db_path` itself
+    with closing(_connect(db_path)) as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
+
+        # Step 1: Get all table names and their schemas
+        logger.debug("Inspecting SQLite database at %s", db_path)
+        cursor.execute("SELECT name, sql FROM sqlite_master WHERE type='table';")
+        tables = [(row["name"], row["sql"]) for row in cursor.fetchall()]
         db_info = {}
 
-        for table in tables:
-            # Step 2: Get schema
-            print(f"[DEBUG] Inspecting table: {table}")
+        for table, schema in tables:
+            # Step 2: Get the first few rows
+            logger.debug("Fetching sample rows from table: %s", table)
+            # Table names cannot be bound as parameters. They come from
+            # sqlite_master and are quoted, so each SQL text is stable and is
+            # compiled once per connection by the statement cache.
             cursor.execute(
-                f"SELECT sql FROM sqlite_master WHERE type='table' AND name=?;",
-                (table,),
+                f"SELECT * FROM {_quote_identifier(table)} LIMIT {_SAMPLE_ROWS};"
             )
-            schema = cursor.fetchone()["sql"]
-
-            # Step 3: Get first 5 rows
-            print(f"[DEBUG] Fetching sample rows from table: {table}")
-            cursor.execute(f"SELECT * FROM {table} LIMIT 5;")
-            rows = [dict(r) for r in cursor.fetchall()]
+            rows = [dict(r) for r in cursor.fetchmany(_SAMPLE_ROWS)]
 
             db_info[table] = {"schema": schema, "sample_rows": rows}
 
-        return json.dumps(db_info, indent=2)
+    return json.dumps(db_info, indent=2)
+
+
+def _inspect_sqlite_db() -> str:
+    """
+    Inspect the complete structure of the budget database.
+    
+    Returns all table names, their CREATE TABLE schemas, and the first 5 sample rows
+    from each table in JSON format. Use this before querying to understand the database structure.
+    """
+    try:
+        stat = os.stat(DB_PATH)
+        return _inspect_cached(DB_PATH, stat.st_mtime_ns, stat.st_size)
 
-    except sqlite3.Error as e:
+    except (OSError, sqlite3.Error) as e:
         return json.dumps({"error": str(e)})
 
-    finally:
-        conn.close()
 
+async def _ainspect_sqlite_db() -> str:
+    """Run `_inspect_sqlite_db` in a worker thread."""
+    return await asyncio.to_thread(_inspect_sqlite_db)
+
+
+inspect_sqlite_db = StructuredTool.from_function(
+    func=_inspect_sqlite_db,
+    coroutine=_ainspect_sqlite_db,
+    name="inspect_sqlite_db",
+)
+
+
+TOOLS: List[BaseTool] = [
+    get_todays_date,
+    inspect_sqlite_db,
+    execute_sqlite_select,
+    execute_sqlite_select_batch,
+]
 
-TOOLS: List[Callable[..., Any]] = [get_todays_date, inspect_sqlite_db, execute_sqlite_select]
\ No newline at end of file
+TOOLS_BY_NAME: Dict[str, BaseTool] = {t.name: t for t in TOOLS}
+if len(TOOLS_BY_NAME) != len(TOOLS):
+    raise ValueError(f"Duplicate tool names in TOOLS: {[t.name for t in TOOLS]}")
\ No newline at end of file
@@ -0,0 +1,80 @@
+"""Shared fixtures for unit tests."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+BUDGET_TRACKER_ROWS = [
+    (1, "2024-01-15", "Groceries", 100.50, 2024, 1, 15),
+    (2, "2024-01-16", "Transport", 50.00, 2024, 1, 16),
+]
+
+BUDGET_SET_ROWS = [
+    (1, "Jan 2024", "Groceries", 500.00),
+]
+
+
+def _build_template() -> bytes:
+    """Create the test budget database and return it as a serialized image."""
+    conn = sqlite3.connect(":memory:")
+    with conn:
+        conn.execute(
+            """
+            CREATE TABLE budget_tracker (
+                id INTEGER PRIMARY KEY,
+                Date TEXT,
+                Category TEXT,
+                Expenditure REAL,
+                Year INT,
+                Month INT,
+                Day INT
+            )
+        """
+        )
+        conn.execute(
+            """
+            CREATE TABLE budget_set (
+                id INTEGER PRIMARY KEY,
+                MonthYear TEXT,
+                Category TEXT,
+                Budget REAL
+            )
+        """
+        )
+
+        conn.executemany(
+            "INSERT INTO budget_tracker VALUES (?, ?, ?, ?, ?, ?, ?)",
+            BUDGET_TRACKER_ROWS,
+        )
+        conn.executemany("INSERT INTO budget_set VALUES (?, ?, ?, ?)", BUDGET_SET_ROWS)
+    image = conn.serialize()
+    conn.close()
+    return image
+
+
+_TEMPLATE = _build_template()
+
+
+@pytest.fixture(scope="session")
+def budget_db_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the test budget database to a file for code that stats DB_PATH."""
+    path = tmp_path_factory.mktemp("db") / "budget.db"
+    path.write_bytes(_TEMPLATE)
+    return path
+
+
+@pytest.fixture(scope="module")
+def shared_conn() -> sqlite3.Connection:
+    """Give each test module one in-memory copy of the test budget database.
+
+    The schema and rows are built once at import and loaded from their
+    serialized bytes, so no connection or file is shared between modules or
+    pytest-xdist workers. The copy is read-only and shared by every test in
+    the module, so the tests open one connection instead of one each.
+    """
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.deserialize(_TEMPLATE)
+    conn.execute("PRAGMA query_only=1")
+    yield conn
+    conn.close()
@@ -1,9 +1,19 @@
 """Unit tests for graph module."""
 
-import pytest
-from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from react_agent.graph import route_model_output
+import pytest
+from langchain_core.messages import (
+    AIMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from langgraph.runtime import Runtime
+
+from react_agent.context import Context
+from react_agent.graph import call_model, route_model_output
+from react_agent.prompts import SYSTEM_MESSAGE
 from react_agent.state import State
 
 
@@ -201,3 +211,40 @@ class TestRouteModelOutput:
         result = route_model_output(state)
 
         assert result == "__end__"
+
+
+class TestCallModel:
+    """Tests for call_model node."""
+
+    @pytest.fixture
+    def model(self) -> MagicMock:
+        """Patch the chat model so it answers without calling a provider."""
+        bound = MagicMock()
+        bound.ainvoke = AsyncMock(return_value=AIMessage(content="Done"))
+        with patch("react_agent.graph.load_chat_model") as mock_load:
+            mock_load.return_value.bind_tools.return_value = bound
+            yield bound
+
+    @pytest.mark.anyio
+    async def test_call_model_reuses_default_system_message(
+        self, model: MagicMock
+    ) -> None:
+        """Test that the default prompt is sent as the prebuilt SystemMessage."""
+        state = State(messages=[HumanMessage(content="Hi")])
+
+        result = await call_model(state, Runtime(context=Context()))
+
+        sent = model.ainvoke.call_args.args[0]
+        assert sent[0] is SYSTEM_MESSAGE
+        assert result["messages"][0].content == "Done"
+
+    @pytest.mark.anyio
+    async def test_call_model_uses_custom_system_prompt(self, model: MagicMock) -> None:
+        """Test that a custom prompt from the context is sent instead."""
+        state = State(messages=[HumanMessage(content="Hi")])
+
+        await call_model(state, Runtime(context=Context(system_prompt="Be brief.")))
+
+        sent = model.ainvoke.call_args.args[0]
+        assert isinstance(sent[0], SystemMessage)
+        assert sent[0].content == "Be brief."
@@ -0,0 +1,17 @@
+"""Unit tests for prompts module."""
+
+from react_agent.prompts import SYSTEM_PROMPT, SYSTEM_PROMPT_VERBOSE
+from react_agent.tools import TOOLS
+
+
+class TestSystemPrompt:
+    """Tests for the default system prompt."""
+
+    def test_system_prompt_names_every_tool(self) -> None:
+        """Test that the prompt mentions every registered tool by name."""
+        for tool in TOOLS:
+            assert tool.name in SYSTEM_PROMPT
+
+    def test_system_prompt_is_shorter_than_verbose_prompt(self) -> None:
+        """Test that the compact prompt is under half the verbose prompt's length."""
+        assert len(SYSTEM_PROMPT) < len(SYSTEM_PROMPT_VERBOSE) / 2
@@ -1,5 +1,8 @@
 """Unit tests for state module."""
 
+import operator
+from typing import get_type_hints
+
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 
 from react_agent.state import InputState, State
@@ -81,6 +84,11 @@ class TestState:
         assert len(state.query) == 3
         assert state.query == queries
 
+    def test_state_query_field_appends_updates(self) -> None:
+        """Test that query updates are merged with operator.add."""
+        hints = get_type_hints(State, include_extras=True)
+        assert hints["query"].__metadata__ == (operator.add,)
+
     def test_state_is_last_step_is_boolean(self) -> None:
         """Test that is_last_step is a boolean field."""
         state1 = State(is_last_step=True)
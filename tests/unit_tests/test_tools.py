@@ -1,32 +1,90 @@
 """Unit tests for tools module."""
 
 import json
+import logging
+import os
 import sqlite3
-import tempfile
-from datetime import date
 from pathlib import Path
-from unittest.mock import MagicMock, patch, create_autospec
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, patch
 
 import pytest
+from langgraph.types import Command
 
 from react_agent.tools import (
+    TOOLS,
+    TOOLS_BY_NAME,
     execute_sqlite_select,
+    execute_sqlite_select_batch,
     get_todays_date,
     inspect_sqlite_db,
 )
 import react_agent.tools as tools_module
 
-# Helper function to create mock runtime
-def create_mock_runtime(tool_call_id: str = "test-call-id"):
-    """Create a mock ToolRuntime for testing."""
-    mock_runtime = MagicMock()
-    mock_runtime.tool_call_id = tool_call_id
-    return mock_runtime
+_run_select = execute_sqlite_select.func
+_run_select_batch = execute_sqlite_select_batch.func
+_run_inspect = inspect_sqlite_db.invoke
+
+
+@pytest.fixture(autouse=True)
+def reset_connection() -> None:
+    """Drop pooled database connections and the cached schema between tests."""
+    tools_module._close_connections()
+    tools_module._inspect_cached.cache_clear()
+    yield
+    tools_module._close_connections()
+    tools_module._inspect_cached.cache_clear()
+
+
+class _NonClosingProxy:
+    """Wrap the shared test connection so the tools cannot close it."""
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+
+    def close(self) -> None:
+        # Keep the connection open, but drop the read-only authorizer so the
+        # next test's _connect() can run its PRAGMAs again.
+        self._conn.set_authorizer(None)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+
+@pytest.fixture
+def patched_sqlite(
+    shared_conn: sqlite3.Connection,
+    budget_db_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> SimpleNamespace:
+    """Replace the tools' sqlite3 module so connections go to the test database.
+
+    Only connect() is faked; Row, Error and the rest stay the real objects.
+    DB_PATH points at a file copy of the test database, so nothing reads the
+    production database or depends on the working directory.
+    """
+    fake = SimpleNamespace(**vars(sqlite3))
+    fake.connect = MagicMock(return_value=_NonClosingProxy(shared_conn))
+    monkeypatch.setattr(tools_module, "sqlite3", fake)
+    monkeypatch.setattr(tools_module, "DB_PATH", str(budget_db_path))
+    return fake
+
+
+@pytest.fixture(scope="module")
+def runtime() -> SimpleNamespace:
+    """Share one stand-in ToolRuntime; the tools only read its tool_call_id."""
+    return SimpleNamespace(tool_call_id="test-call-id")
 
 
 class TestGetTodaysDate:
     """Tests for get_todays_date tool."""
 
+    @pytest.fixture(autouse=True)
+    def reset_today_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Expire the cached date before each test."""
+        monkeypatch.setattr(tools_module, "_today_expires", 0.0)
+
     def test_get_todays_date_returns_string(self) -> None:
         """Test that get_todays_date returns a string."""
         result = get_todays_date.invoke({})
@@ -40,111 +98,143 @@ class TestGetTodaysDate:
         assert result[4] == "-"
         assert result[7] == "-"
 
+    def test_get_todays_date_logs_at_debug(
+        self, caplog: pytest.LogCaptureFixture, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that tool calls are logged at DEBUG level instead of printed."""
+        with caplog.at_level(logging.DEBUG, logger="react_agent.tools"):
+            get_todays_date.invoke({})
+
+        assert "get_todays_date tool called" in caplog.text
+        assert capsys.readouterr().out == ""
+
     @patch("react_agent.tools.date")
     def test_get_todays_date_mocked(self, mock_date: MagicMock) -> None:
         """Test get_todays_date with mocked date."""
         mock_today = MagicMock()
-        mock_today.strftime.return_value = "2025-08-14"
+        mock_today.isoformat.return_value = "2025-08-14"
         mock_date.today.return_value = mock_today
 
         result = get_todays_date.invoke({})
 
         assert result == "2025-08-14"
-        mock_today.strftime.assert_called_once_with("%Y-%m-%d")
+        mock_today.isoformat.assert_called_once_with()
 
+    @patch("react_agent.tools.date")
+    def test_get_todays_date_is_cached(self, mock_date: MagicMock) -> None:
+        """Test that repeated calls reuse the cached date."""
+        mock_date.today.return_value.isoformat.return_value = "2025-08-14"
 
-class TestInspectSqliteDb:
-    """Tests for inspect_sqlite_db tool."""
+        assert get_todays_date.invoke({}) == "2025-08-14"
+        assert get_todays_date.invoke({}) == "2025-08-14"
 
-    @pytest.fixture
-    def temp_db(self) -> Path:
-        """Create a temporary test database."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".db") as f:
-            db_path = Path(f.name)
+        mock_date.today.assert_called_once_with()
 
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        # Create test tables
-        cursor.execute(
-            """
-            CREATE TABLE budget_tracker (
-                id INTEGER PRIMARY KEY,
-                Date TEXT,
-                Category TEXT,
-                Expenditure REAL,
-                Year INT,
-                Month INT,
-                Day INT
-            )
-        """
-        )
+    @patch("react_agent.tools.time")
+    @patch("react_agent.tools.date")
+    def test_get_todays_date_expires_at_midnight(
+        self, mock_date: MagicMock, mock_time: MagicMock
+    ) -> None:
+        """Test that the cached date is not reused past midnight."""
+        mock_date.today.return_value.isoformat.side_effect = ["2025-08-14", "2025-08-15"]
+        # 23:59:50 local time, then 15 seconds later
+        mock_time.time.side_effect = [1000.0, 1015.0]
+        mock_time.localtime.return_value = MagicMock(tm_hour=23, tm_min=59, tm_sec=50)
+
+        assert get_todays_date.invoke({}) == "2025-08-14"
+        assert get_todays_date.invoke({}) == "2025-08-15"
+
+    @patch("react_agent.tools.time")
+    @patch("react_agent.tools.date")
+    def test_get_todays_date_expires_at_midnight_mid_second(
+        self, mock_date: MagicMock, mock_time: MagicMock
+    ) -> None:
+        """Test that a date cached part-way through 23:59:59 expires at midnight."""
+        mock_date.today.return_value.isoformat.side_effect = ["2025-08-14", "2025-08-15"]
+        # 23:59:59.75 local time, then exactly midnight
+        mock_time.time.side_effect = [1000.75, 1001.0]
+        mock_time.localtime.return_value = MagicMock(tm_hour=23, tm_min=59, tm_sec=59)
 
-        cursor.execute(
-            """
-            CREATE TABLE budget_set (
-                id INTEGER PRIMARY KEY,
-                MonthYear TEXT,
-                Category TEXT,
-                Budget REAL
-            )
-        """
-        )
+        assert get_todays_date.invoke({}) == "2025-08-14"
+        assert get_todays_date.invoke({}) == "2025-08-15"
 
-        # Insert sample data
-        cursor.execute(
-            """
-            INSERT INTO budget_tracker VALUES
-            (1, '2024-01-15', 'Groceries', 100.50, 2024, 1, 15),
-            (2, '2024-01-16', 'Transport', 50.00, 2024, 1, 16)
-        """
-        )
 
-        cursor.execute(
-            """
-            INSERT INTO budget_set VALUES
-            (1, 'Jan 2024', 'Groceries', 500.00)
-        """
-        )
+@pytest.mark.usefixtures("patched_sqlite")
+class TestInspectSqliteDb:
+    """Tests for inspect_sqlite_db tool."""
 
-        conn.commit()
+    def test_inspect_sqlite_db(self) -> None:
+        """Test that every table is described by its schema and up to 5 sample rows."""
+        data = json.loads(_run_inspect({}))
+
+        assert isinstance(data, dict)
+        assert "budget_tracker" in data
+        assert "budget_set" in data
+        assert "schema" in data["budget_tracker"]
+        assert len(data["budget_tracker"]["sample_rows"]) <= 5
+        assert len(data["budget_set"]["sample_rows"]) <= 5
+
+    def test_inspect_sqlite_db_quotes_table_names(
+        self, patched_sqlite: SimpleNamespace, tmp_path: Path
+    ) -> None:
+        """Test that tables whose names need quoting are sampled correctly."""
+        db_path = tmp_path / "quoted.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA journal_mode=MEMORY")
+        conn.execute("PRAGMA synchronous=OFF")
+        with conn:
+            conn.execute('CREATE TABLE "monthly ""plan""" (Category TEXT)')
+            conn.executemany('INSERT INTO "monthly ""plan""" VALUES (?)', [("Rent",)])
+
+        # Hand the setup connection to the tools; the pool closes it on teardown
+        patched_sqlite.connect.return_value = conn
+
+        data = json.loads(_run_inspect({}))
+
+        assert data['monthly "plan"']["sample_rows"] == [{"Category": "Rent"}]
+
+    def test_inspect_sqlite_db_is_cached(self) -> None:
+        """Test that the schema is read once while the database file is unchanged."""
+        first = _run_inspect({})
+        second = _run_inspect({})
+
+        assert first == second
+        assert tools_module._inspect_cached.cache_info().hits == 1
+
+    def test_inspect_sqlite_db_cache_is_keyed_by_path(
+        self,
+        patched_sqlite: SimpleNamespace,
+        budget_db_path: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that another database file with the same mtime and size is re-read."""
+        other_path = tmp_path / "other.db"
+        conn = sqlite3.connect(other_path)
+        with conn:
+            # Two tables, like the budget database, so both files have equal size
+            conn.execute("CREATE TABLE alpha (x)")
+            conn.execute("CREATE TABLE beta (x)")
         conn.close()
+        stat = budget_db_path.stat()
+        assert other_path.stat().st_size == stat.st_size
+        os.utime(other_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        # Open real connections so each file is actually read
+        patched_sqlite.connect.side_effect = sqlite3.connect
 
-        yield db_path
-
-        # Cleanup
-        db_path.unlink()
+        first = json.loads(_run_inspect({}))
+        monkeypatch.setattr(tools_module, "DB_PATH", str(other_path))
+        second = json.loads(_run_inspect({}))
 
-    def test_inspect_sqlite_db_structure(self, temp_db: Path) -> None:
-        """Test that inspect_sqlite_db returns proper structure."""
-        # Mock the db_path in the tool
-        with patch.object(tools_module, 'sqlite3') as mock_sqlite:
-            mock_sqlite.connect.return_value = sqlite3.connect(temp_db)
-            mock_sqlite.Row = sqlite3.Row
-            mock_sqlite.Error = sqlite3.Error
+        assert set(first) == {"budget_tracker", "budget_set"}
+        assert set(second) == {"alpha", "beta"}
 
-            result = inspect_sqlite_db.invoke({})
-            data = json.loads(result)
+    def test_inspect_sqlite_db_missing_file(self, tmp_path: Path) -> None:
+        """Test that a missing database file is reported as an error."""
+        with patch.object(tools_module, "DB_PATH", str(tmp_path / "missing.db")):
+            data = json.loads(_run_inspect({}))
 
-            assert isinstance(data, dict)
-            assert "budget_tracker" in data
-            assert "budget_set" in data
-            assert "schema" in data["budget_tracker"]
-            assert "sample_rows" in data["budget_tracker"]
-
-    def test_inspect_sqlite_db_sample_rows_limit(self, temp_db: Path) -> None:
-        """Test that inspect_sqlite_db returns max 5 sample rows."""
-        with patch.object(tools_module, 'sqlite3') as mock_sqlite:
-            mock_sqlite.connect.return_value = sqlite3.connect(temp_db)
-            mock_sqlite.Row = sqlite3.Row
-            mock_sqlite.Error = sqlite3.Error
-
-            result = inspect_sqlite_db.invoke({})
-            data = json.loads(result)
-
-            # Should return at most 5 rows
-            assert len(data["budget_tracker"]["sample_rows"]) <= 5
-            assert len(data["budget_set"]["sample_rows"]) <= 5
+        assert "error" in data
 
     @patch("react_agent.tools.sqlite3.connect")
     def test_inspect_sqlite_db_error_handling(self, mock_connect: MagicMock) -> None:
@@ -155,158 +245,350 @@ class TestInspectSqliteDb:
         mock_conn.cursor.return_value = mock_cursor
         mock_cursor.execute.side_effect = sqlite3.Error("Database error")
 
-        result = inspect_sqlite_db.invoke({})
+        result = _run_inspect({})
         data = json.loads(result)
 
         assert "error" in data
         assert "Database error" in data["error"]
 
 
-class TestExecuteSqliteSelect:
-    """Tests for execute_sqlite_select tool."""
+class TestExecuteSqliteSelectRejects:
+    """Tests for queries execute_sqlite_select refuses before opening a connection."""
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "DELETE FROM budget_tracker",
+            "INSERT INTO budget_tracker VALUES (3, 'Food', 75.00)",
+            "UPDATE budget_tracker SET Expenditure = 0",
+            "DROP TABLE budget_tracker",
+            "-- select\nDELETE FROM budget_tracker",
+        ],
+        ids=["delete", "insert", "update", "drop", "commented-out-select"],
+    )
+    def test_execute_sqlite_select_rejects_non_select(
+        self, runtime: SimpleNamespace, query: str
+    ) -> None:
+        """Test that non-SELECT queries are rejected by the guard."""
+        result = _run_select(query=query, runtime=runtime)
+
+        text = result.update["messages"][0].content
+        assert isinstance(text, str)
+        assert text.startswith("Error: Only SELECT queries are allowed")
+        assert "query" not in result.update
+        assert tools_module._pool.empty()
+
+
+@pytest.mark.usefixtures("patched_sqlite")
+class TestExecuteSqliteSelectQueries:
+    """Tests for queries execute_sqlite_select runs against the database."""
+
+    def test_execute_sqlite_select_valid_query(self, runtime: SimpleNamespace) -> None:
+        """Test executing a valid SELECT query."""
+        result = _run_select(query="SELECT * FROM budget_tracker", runtime=runtime)
 
-    @pytest.fixture(autouse=True)
-    def reset_query_list(self) -> None:
-        """Reset the global query_list before each test."""
-        tools_module.query_list.clear()
+        assert isinstance(result, Command)
+        assert "messages" in result.update
+        assert "query" in result.update
 
-    @pytest.fixture
-    def temp_db(self) -> Path:
-        """Create a temporary test database."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".db") as f:
-            db_path = Path(f.name)
+    def test_execute_sqlite_select_allows_leading_comments(
+        self, runtime: SimpleNamespace
+    ) -> None:
+        """Test that comments before SELECT are accepted."""
+        query = "/* total */\n-- groceries\n  select COUNT(*) FROM budget_tracker"
+        result = _run_select(query=query, runtime=runtime)
 
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            CREATE TABLE budget_tracker (
-                id INTEGER PRIMARY KEY,
-                Category TEXT,
-                Expenditure REAL
-            )
-        """
-        )
+        assert result.update["query"] == [query]
 
-        cursor.execute(
-            """
-            INSERT INTO budget_tracker VALUES
-            (1, 'Groceries', 100.50),
-            (2, 'Transport', 50.00)
-        """
-        )
-
-        conn.commit()
-        conn.close()
+    def test_execute_sqlite_select_tracks_queries(
+        self, runtime: SimpleNamespace
+    ) -> None:
+        """Test that executed queries are tracked in state."""
+        query = "SELECT * FROM budget_tracker WHERE Category = 'Groceries'"
+        result = _run_select(query=query, runtime=runtime)
 
-        yield db_path
-        db_path.unlink()
+        # Only the query run by this call is reported; the State reducer
+        # appends it to the conversation's history
+        assert result.update["query"] == [query]
 
-    def test_execute_sqlite_select_valid_query(self, temp_db: Path) -> None:
-        """Test executing a valid SELECT query."""
-        with patch.object(tools_module, 'sqlite3') as mock_sqlite:
-            mock_sqlite.connect.return_value = sqlite3.connect(temp_db)
-            mock_sqlite.Error = sqlite3.Error
+    def test_execute_sqlite_select_handles_errors(
+        self, patched_sqlite: SimpleNamespace, runtime: SimpleNamespace
+    ) -> None:
+        """Test that database errors are handled gracefully."""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        patched_sqlite.connect.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.execute.side_effect = sqlite3.Error("Syntax error")
 
-            runtime = create_mock_runtime()
+        result = _run_select(query="SELECT * FROM nonexistent", runtime=runtime)
 
-            # Call the function directly instead of through invoke
-            result = execute_sqlite_select.func(
-                query="SELECT * FROM budget_tracker", runtime=runtime
-            )
+        text = result.update["messages"][0].content
+        assert isinstance(text, str)
+        assert "Error executing query" in text
 
-            assert hasattr(result, "update")
-            assert "messages" in result.update
-            assert "query" in result.update
+    def test_execute_sqlite_select_returns_dict_results(
+        self, runtime: SimpleNamespace
+    ) -> None:
+        """Test that results are returned as list of dicts."""
+        result = _run_select(
+            query="SELECT * FROM budget_tracker LIMIT 1", runtime=runtime
+        )
 
-    def test_execute_sqlite_select_rejects_non_select(self) -> None:
-        """Test that non-SELECT queries are rejected."""
-        runtime = create_mock_runtime()
+        message_content = result.update["messages"][0].content
+        assert isinstance(message_content, str)
+        # Should contain dict-like structure with column names
+        assert "Category" in message_content or "Expenditure" in message_content
 
-        # Call the function directly
-        result = execute_sqlite_select.func(
-            query="DELETE FROM budget_tracker", runtime=runtime
+    def test_execute_sqlite_select_returns_json(self, runtime: SimpleNamespace) -> None:
+        """Test that results are serialized as a JSON array of row objects."""
+        result = _run_select(
+            query="SELECT Category, Expenditure FROM budget_tracker ORDER BY id",
+            runtime=runtime,
         )
 
-        assert hasattr(result, "update")
-        assert "Only SELECT queries are allowed" in str(result.update["messages"][0].content)
+        rows = json.loads(result.update["messages"][0].content)
+        assert rows == [
+            {"Category": "Groceries", "Expenditure": 100.50},
+            {"Category": "Transport", "Expenditure": 50.00},
+        ]
+
+    def test_execute_sqlite_select_joins_fetch_batches(
+        self, runtime: SimpleNamespace
+    ) -> None:
+        """Test that rows fetched across several batches form one JSON array."""
+        with patch.object(tools_module, "_FETCH_BATCH", 1):
+            result = _run_select(
+                query="SELECT id FROM budget_tracker ORDER BY id", runtime=runtime
+            )
 
-    def test_execute_sqlite_select_rejects_insert(self) -> None:
-        """Test that INSERT queries are rejected."""
-        runtime = create_mock_runtime()
+            assert json.loads(result.update["messages"][0].content) == [
+                {"id": 1},
+                {"id": 2},
+            ]
 
-        result = execute_sqlite_select.func(
-            query="INSERT INTO budget_tracker VALUES (3, 'Food', 75.00)",
-            runtime=runtime,
+    def test_execute_sqlite_select_aggregate(self, runtime: SimpleNamespace) -> None:
+        """Test that a single-row aggregate is returned as a one-element JSON array."""
+        result = _run_select(
+            query="SELECT SUM(Expenditure) FROM budget_tracker", runtime=runtime
         )
 
-        assert "Only SELECT queries are allowed" in str(result.update["messages"][0].content)
+        assert json.loads(result.update["messages"][0].content) == [
+            {"SUM(Expenditure)": 150.50}
+        ]
+
+    def test_execute_sqlite_select_result_filling_one_batch(
+        self, runtime: SimpleNamespace
+    ) -> None:
+        """Test a result whose size is exactly one fetch batch."""
+        with patch.object(tools_module, "_FETCH_BATCH", 2):
+            result = _run_select(
+                query="SELECT id FROM budget_tracker ORDER BY id", runtime=runtime
+            )
 
-    def test_execute_sqlite_select_rejects_update(self) -> None:
-        """Test that UPDATE queries are rejected."""
-        runtime = create_mock_runtime()
+            assert json.loads(result.update["messages"][0].content) == [
+                {"id": 1},
+                {"id": 2},
+            ]
 
-        result = execute_sqlite_select.func(
-            query="UPDATE budget_tracker SET Expenditure = 0", runtime=runtime
+    def test_execute_sqlite_select_empty_result(self, runtime: SimpleNamespace) -> None:
+        """Test that a query matching no rows returns an empty JSON array."""
+        result = _run_select(
+            query="SELECT * FROM budget_tracker WHERE id < 0", runtime=runtime
         )
 
-        assert "Only SELECT queries are allowed" in str(result.update["messages"][0].content)
+        assert result.update["messages"][0].content == "[]"
 
-    def test_execute_sqlite_select_rejects_drop(self) -> None:
-        """Test that DROP queries are rejected."""
-        runtime = create_mock_runtime()
+    def test_execute_sqlite_select_json_without_orjson(
+        self, runtime: SimpleNamespace
+    ) -> None:
+        """Test that the standard library encoder is used when orjson is missing."""
+        with patch.object(tools_module, "orjson", None):
+            result = _run_select(
+                query="SELECT Category FROM budget_tracker ORDER BY id",
+                runtime=runtime,
+            )
 
-        result = execute_sqlite_select.func(
-            query="DROP TABLE budget_tracker", runtime=runtime
+            assert result.update["messages"][0].content == (
+                '[{"Category":"Groceries"},{"Category":"Transport"}]'
+            )
+
+    def test_execute_sqlite_select_reuses_pooled_connection(
+        self, patched_sqlite: SimpleNamespace, runtime: SimpleNamespace
+    ) -> None:
+        """Test that consecutive queries reuse the same pooled connection."""
+        _run_select(query="SELECT 1", runtime=runtime)
+        _run_select(query="SELECT 2", runtime=runtime)
+
+        assert patched_sqlite.connect.call_count == 1
+        assert tools_module._pool.qsize() == 1
+
+    def test_execute_sqlite_select_skips_connections_to_previous_path(
+        self,
+        patched_sqlite: SimpleNamespace,
+        runtime: SimpleNamespace,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a pooled connection is not reused after DB_PATH changes."""
+        other_path = tmp_path / "other.db"
+        conn = sqlite3.connect(other_path)
+        with conn:
+            conn.execute("CREATE TABLE budget_tracker (Category TEXT)")
+            conn.execute("INSERT INTO budget_tracker VALUES ('Rent')")
+        conn.close()
+        # Open real connections so each file is actually read
+        patched_sqlite.connect.side_effect = sqlite3.connect
+        query = "SELECT COUNT(*) AS n FROM budget_tracker"
+
+        first = _run_select(query=query, runtime=runtime)
+        monkeypatch.setattr(tools_module, "DB_PATH", str(other_path))
+        second = _run_select(query=query, runtime=runtime)
+
+        assert json.loads(first.update["messages"][0].content) == [{"n": 2}]
+        assert json.loads(second.update["messages"][0].content) == [{"n": 1}]
+        assert tools_module._pool.qsize() == 1
+
+    def test_pooled_connections_are_read_only(self) -> None:
+        """Test that pooled connections refuse writes."""
+        with tools_module._connection() as conn:
+            with pytest.raises(sqlite3.DatabaseError, match="not authorized"):
+                conn.execute("DELETE FROM budget_tracker")
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "ATTACH DATABASE ':memory:' AS other",
+            "PRAGMA query_only=0",
+            "CREATE TEMP TABLE scratch (x)",
+        ],
+        ids=["attach", "pragma", "temp-table"],
+    )
+    def test_pooled_connections_deny_non_read_statements(self, statement: str) -> None:
+        """Test that the authorizer refuses statements that are not plain reads."""
+        with tools_module._connection() as conn:
+            with pytest.raises(sqlite3.DatabaseError, match="not authorized"):
+                conn.execute(statement)
+
+    def test_pooled_connections_allow_recursive_select(self) -> None:
+        """Test that recursive CTEs and functions are still allowed."""
+        with tools_module._connection() as conn:
+            rows = conn.execute(
+                "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 3) "
+                "SELECT MAX(i) FROM n"
+            ).fetchall()
+
+        assert rows == [(3,)]
+
+
+@pytest.mark.usefixtures("patched_sqlite")
+class TestExecuteSqliteSelectBatch:
+    """Tests for execute_sqlite_select_batch tool."""
+
+    def test_execute_sqlite_select_batch_runs_all_queries(
+        self, patched_sqlite: SimpleNamespace, runtime: SimpleNamespace
+    ) -> None:
+        """Test that every query's rows are returned in one message."""
+        queries = [
+            "SELECT COUNT(*) AS n FROM budget_tracker",
+            "SELECT Category FROM budget_tracker WHERE Expenditure > 60",
+        ]
+
+        result = _run_select_batch(queries=queries, runtime=runtime)
+
+        assert len(result.update["messages"]) == 1
+        data = json.loads(result.update["messages"][0].content)
+        assert data == [
+            {"query": queries[0], "rows": [{"n": 2}]},
+            {"query": queries[1], "rows": [{"Category": "Groceries"}]},
+        ]
+        assert result.update["query"] == queries
+        assert patched_sqlite.connect.call_count == 1
+
+    def test_execute_sqlite_select_batch_reports_errors_per_query(
+        self, runtime: SimpleNamespace
+    ) -> None:
+        """Test that rejected and failing queries don't stop the rest."""
+        queries = [
+            "DELETE FROM budget_tracker",
+            "SELECT * FROM nonexistent",
+            "SELECT COUNT(*) AS n FROM budget_tracker",
+        ]
+
+        result = _run_select_batch(queries=queries, runtime=runtime)
+
+        data = json.loads(result.update["messages"][0].content)
+        assert [entry["query"] for entry in data] == queries
+        assert data[0]["error"].startswith("Only SELECT queries are allowed")
+        assert "Error executing query" in data[1]["error"]
+        assert data[2]["rows"] == [{"n": 2}]
+        assert result.update["query"] == [queries[2]]
+
+    def test_execute_sqlite_select_batch_keeps_repeated_queries(
+        self, runtime: SimpleNamespace
+    ) -> None:
+        """Test that a query repeated in the batch gets one result per occurrence."""
+        query = "SELECT COUNT(*) AS n FROM budget_tracker"
+
+        result = _run_select_batch(queries=[query, query], runtime=runtime)
+
+        data = json.loads(result.update["messages"][0].content)
+        assert data == [{"query": query, "rows": [{"n": 2}]}] * 2
+        assert result.update["query"] == [query, query]
+
+    def test_execute_sqlite_select_batch_handles_connection_errors(
+        self, patched_sqlite: SimpleNamespace, runtime: SimpleNamespace
+    ) -> None:
+        """Test that a connection failure is returned as a message, not raised."""
+        patched_sqlite.connect.side_effect = sqlite3.OperationalError(
+            "unable to open database file"
         )
 
-        assert "Only SELECT queries are allowed" in str(result.update["messages"][0].content)
+        result = _run_select_batch(queries=["SELECT 1"], runtime=runtime)
 
-    def test_execute_sqlite_select_tracks_queries(self, temp_db: Path) -> None:
-        """Test that executed queries are tracked in state."""
-        with patch.object(tools_module, 'sqlite3') as mock_sqlite:
-            mock_sqlite.connect.return_value = sqlite3.connect(temp_db)
-            mock_sqlite.Error = sqlite3.Error
+        text = result.update["messages"][0].content
+        assert text == "Error executing query: unable to open database file"
+        assert "query" not in result.update
 
-            runtime = create_mock_runtime()
+    def test_execute_sqlite_select_batch_all_rejected(
+        self, runtime: SimpleNamespace
+    ) -> None:
+        """Test that no query history is reported when nothing ran."""
+        result = _run_select_batch(
+            queries=["DROP TABLE budget_tracker"], runtime=runtime
+        )
 
-            query = "SELECT * FROM budget_tracker WHERE Category = 'Groceries'"
-            result = execute_sqlite_select.func(query=query, runtime=runtime)
+        assert "query" not in result.update
 
-            # Query should be added to the query list
-            assert query in result.update["query"]
 
-    def test_execute_sqlite_select_handles_errors(self) -> None:
-        """Test that database errors are handled gracefully."""
-        with patch.object(tools_module, 'sqlite3') as mock_sqlite:
-            mock_conn = MagicMock()
-            mock_cursor = MagicMock()
-            mock_sqlite.connect.return_value = mock_conn
-            mock_sqlite.Error = sqlite3.Error
-            mock_conn.cursor.return_value = mock_cursor
-            mock_cursor.execute.side_effect = sqlite3.Error("Syntax error")
-
-            runtime = create_mock_runtime()
-
-            result = execute_sqlite_select.func(
-                query="SELECT * FROM nonexistent", runtime=runtime
-            )
+@pytest.mark.usefixtures("patched_sqlite")
+class TestAsyncTools:
+    """Tests for the async entry points of the database tools."""
 
-            assert "Error executing query" in str(result.update["messages"][0].content)
+    @pytest.mark.anyio
+    async def test_execute_sqlite_select_async(self, runtime: SimpleNamespace) -> None:
+        """Test that the async implementation returns the same Command shape."""
+        result = await execute_sqlite_select.coroutine(
+            query="SELECT 1 AS one", runtime=runtime
+        )
 
-    def test_execute_sqlite_select_returns_dict_results(self, temp_db: Path) -> None:
-        """Test that results are returned as list of dicts."""
-        with patch.object(tools_module, 'sqlite3') as mock_sqlite:
-            mock_sqlite.connect.return_value = sqlite3.connect(temp_db)
-            mock_sqlite.Error = sqlite3.Error
+        assert isinstance(result, Command)
+        assert json.loads(result.update["messages"][0].content) == [{"one": 1}]
+        assert result.update["query"] == ["SELECT 1 AS one"]
 
-            runtime = create_mock_runtime()
+    @pytest.mark.anyio
+    async def test_inspect_sqlite_db_async(self, tmp_path: Path) -> None:
+        """Test that the async implementation reports errors like the sync one."""
+        with patch.object(tools_module, "DB_PATH", str(tmp_path / "missing.db")):
+            data = json.loads(await inspect_sqlite_db.ainvoke({}))
 
-            result = execute_sqlite_select.func(
-                query="SELECT * FROM budget_tracker LIMIT 1", runtime=runtime
-            )
+        assert "error" in data
+
+
+class TestToolRegistry:
+    """Tests for the TOOLS list and TOOLS_BY_NAME mapping."""
 
-            message_content = str(result.update["messages"][0].content)
-            # Should contain dict-like structure with column names
-            assert "Category" in message_content or "Expenditure" in message_content
+    def test_tools_by_name_covers_every_tool(self) -> None:
+        """Test that every tool is reachable by its name."""
+        assert list(TOOLS_BY_NAME) == [t.name for t in TOOLS]
+        assert TOOLS_BY_NAME["execute_sqlite_select"] is execute_sqlite_select
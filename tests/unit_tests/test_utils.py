@@ -1,9 +1,10 @@
 """Unit tests for utils module."""
 
-from unittest.mock import MagicMock, patch
+from typing import Iterator
+from unittest.mock import MagicMock
 
 import pytest
-from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
 
 from react_agent.utils import get_message_text, load_chat_model
 
@@ -11,100 +12,84 @@ from react_agent.utils import get_message_text, load_chat_model
 class TestGetMessageText:
     """Tests for get_message_text function."""
 
-    def test_get_message_text_with_string_content(self) -> None:
-        """Test extracting text from message with string content."""
-        msg = HumanMessage(content="Hello world")
-        assert get_message_text(msg) == "Hello world"
-
-    def test_get_message_text_with_dict_content(self) -> None:
-        """Test extracting text from message with dict content."""
-        msg = AIMessage(content=[{"type": "text", "text": "AI response"}])
-        assert get_message_text(msg) == "AI response"
-
-    def test_get_message_text_with_dict_content_no_text_key(self) -> None:
-        """Test extracting text from dict content without 'text' key."""
-        msg = AIMessage(content=[{"type": "image", "data": "..."}])
-        assert get_message_text(msg) == ""
-
-    def test_get_message_text_with_list_content(self) -> None:
-        """Test extracting text from message with list content."""
-        msg = AIMessage(content=["Hello", " ", "world"])
-        assert get_message_text(msg) == "Hello world"
-
-    def test_get_message_text_with_list_of_dicts(self) -> None:
-        """Test extracting text from message with list of dicts."""
-        msg = AIMessage(content=[{"text": "Hello"}, {"text": " world"}])
-        assert get_message_text(msg) == "Hello world"
-
-    def test_get_message_text_with_mixed_list(self) -> None:
-        """Test extracting text from message with mixed string and dict content."""
-        msg = AIMessage(content=["Hello", {"text": " world"}, "!"])
-        assert get_message_text(msg) == "Hello world!"
-
-    def test_get_message_text_with_empty_content(self) -> None:
-        """Test extracting text from message with empty content."""
-        msg = HumanMessage(content="")
-        assert get_message_text(msg) == ""
-
-    def test_get_message_text_strips_whitespace(self) -> None:
-        """Test that get_message_text strips leading/trailing whitespace."""
-        msg = AIMessage(content=["  ", "text", "  "])
-        assert get_message_text(msg) == "text"
+    @pytest.mark.parametrize(
+        "message,expected",
+        [
+            (HumanMessage(content="Hello world"), "Hello world"),
+            (
+                AIMessage(content=[{"type": "text", "text": "AI response"}]),
+                "AI response",
+            ),
+            (AIMessage(content=[{"type": "image", "data": "..."}]), ""),
+            (AIMessage(content=["Hello", " ", "world"]), "Hello world"),
+            (AIMessage(content=[{"text": "Hello"}, {"text": " world"}]), "Hello world"),
+            (AIMessage(content=["Hello", {"text": " world"}, "!"]), "Hello world!"),
+            (HumanMessage(content=""), ""),
+            (AIMessage(content=["  ", "text", "  "]), "text"),
+        ],
+        ids=[
+            "string",
+            "dict",
+            "dict-without-text",
+            "list-of-strings",
+            "list-of-dicts",
+            "mixed-list",
+            "empty",
+            "strips-whitespace",
+        ],
+    )
+    def test_get_message_text(self, message: BaseMessage, expected: str) -> None:
+        """Test extracting text from each supported content shape."""
+        assert get_message_text(message) == expected
+
+
+@pytest.fixture(scope="class")
+def patched_init() -> Iterator[MagicMock]:
+    """Replace init_chat_model once per test class so no real client is built."""
+    with pytest.MonkeyPatch.context() as mp:
+        mock = MagicMock()
+        mp.setattr("react_agent.utils.init_chat_model", mock)
+        yield mock
 
 
 class TestLoadChatModel:
     """Tests for load_chat_model function."""
 
-    @patch("react_agent.utils.init_chat_model")
-    def test_load_chat_model_with_openai(self, mock_init: MagicMock) -> None:
-        """Test loading OpenAI model."""
-        mock_model = MagicMock()
-        mock_init.return_value = mock_model
-
-        result = load_chat_model("openai/gpt-4o-mini")
-
-        mock_init.assert_called_once_with("gpt-4o-mini", model_provider="openai")
-        assert result == mock_model
-
-    @patch("react_agent.utils.init_chat_model")
-    def test_load_chat_model_with_anthropic(self, mock_init: MagicMock) -> None:
-        """Test loading Anthropic model."""
-        mock_model = MagicMock()
-        mock_init.return_value = mock_model
-
-        result = load_chat_model("anthropic/claude-3-5-sonnet-20241022")
-
-        mock_init.assert_called_once_with(
-            "claude-3-5-sonnet-20241022", model_provider="anthropic"
-        )
-        assert result == mock_model
-
-    @patch("react_agent.utils.init_chat_model")
-    def test_load_chat_model_with_fireworks(self, mock_init: MagicMock) -> None:
-        """Test loading Fireworks model."""
-        mock_model = MagicMock()
-        mock_init.return_value = mock_model
-
-        result = load_chat_model("fireworks/accounts/fireworks/models/llama-v3-70b")
-
-        mock_init.assert_called_once_with(
-            "accounts/fireworks/models/llama-v3-70b", model_provider="fireworks"
-        )
-        assert result == mock_model
+    @pytest.fixture(autouse=True)
+    def mock_init(self, patched_init: MagicMock) -> MagicMock:
+        """Give each test the shared init_chat_model mock with its calls cleared."""
+        patched_init.reset_mock()
+        return patched_init
+
+    @pytest.mark.parametrize(
+        "spec,model,provider",
+        [
+            ("openai/gpt-4o-mini", "gpt-4o-mini", "openai"),
+            (
+                "anthropic/claude-3-5-sonnet-20241022",
+                "claude-3-5-sonnet-20241022",
+                "anthropic",
+            ),
+            (
+                "fireworks/accounts/fireworks/models/llama-v3-70b",
+                "accounts/fireworks/models/llama-v3-70b",
+                "fireworks",
+            ),
+            # Should split only on first slash
+            ("provider/path/to/model", "path/to/model", "provider"),
+        ],
+        ids=["openai", "anthropic", "fireworks", "multiple-slashes"],
+    )
+    def test_load_chat_model(
+        self, mock_init: MagicMock, spec: str, model: str, provider: str
+    ) -> None:
+        """Test that the provider and model name are split and passed through."""
+        result = load_chat_model(spec)
+
+        mock_init.assert_called_once_with(model, model_provider=provider)
+        assert result == mock_init.return_value
 
     def test_load_chat_model_with_invalid_format(self) -> None:
         """Test loading model with invalid format (no slash)."""
         with pytest.raises(ValueError):
             load_chat_model("invalid-model-name")
-
-    @patch("react_agent.utils.init_chat_model")
-    def test_load_chat_model_with_multiple_slashes(self, mock_init: MagicMock) -> None:
-        """Test loading model with multiple slashes in model name."""
-        mock_model = MagicMock()
-        mock_init.return_value = mock_model
-
-        result = load_chat_model("provider/path/to/model")
-
-        # Should split only on first slash
-        mock_init.assert_called_once_with("path/to/model", model_provider="provider")
-        assert result == mock_model